@@ -71,7 +71,8 @@ def load_csv_data(file_path, max_articles=100):
                     'Content Paragraphs': str(row.get('text', 'No content')),
                     'Full Content': str(row.get('text', 'No content')),
                     'Image URLs': '',
-                    'Label': row.get('label', 'Unknown')  # 0=Real, 1=Fake
+                    'Label': row.get('label', 'Unknown'),  # 0=Real, 1=Fake
+                    '_from_training': True  # the classifier was trained on this dataset
                 }
                 articles.append(article)
             
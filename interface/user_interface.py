@@ -2,25 +2,18 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLa
                              QPushButton, QLineEdit, QFrame, QTextEdit, QListWidget, 
                              QSplitter, QProgressBar, QMessageBox, QStackedWidget, QComboBox,
                              QListWidgetItem, QScrollArea, QSizePolicy, QFileDialog)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal
 from PyQt5.QtGui import QPixmap, QFont
 import sys
 import os
-import tempfile
-import shutil
 from datetime import datetime
-import threading
-import concurrent.futures
 
 # Add the parent directory to the path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from scraper import fetch_page_content, enhanced_parse_articles
-from data_handler import save_to_excel, load_excel_data
-
 class ScrapingWorker(QThread):
     """Thread for performing scraping for a single source"""
-    finished = pyqtSignal(dict, str)  # articles_data, source_name
+    scraped = pyqtSignal(dict, str)  # articles_data, source_name
     error = pyqtSignal(str, str)  # error_message, source_name
     progress = pyqtSignal(int, str, str)  # progress_percent, message, source_name
     
@@ -29,6 +22,7 @@ class ScrapingWorker(QThread):
         self.url = url
         self.output_file = output_file
         self.get_full_content = get_full_content
+        self._last_pct = -10  # Last progress value actually emitted
         # Determine source based on URL
         if "npr" in url:
             self.source = "npr"
@@ -37,13 +31,24 @@ class ScrapingWorker(QThread):
         else:
             self.source = "unknown"
     
+    def _emit_progress(self, pct, message):
+        """Emit progress only on a step of at least 5%, or at the start/end"""
+        if pct - self._last_pct >= 5 or pct in (0, 100):
+            self.progress.emit(pct, message, self.source)
+            self._last_pct = pct
+    
     def run(self):
         try:
-            self.progress.emit(10, f"Fetching {self.source} page...", self.source)
+            # Imported here so requests/BeautifulSoup/openpyxl only load once scraping
+            # starts; inside the try so a missing package is reported as an error
+            from scraper import fetch_page_content, enhanced_parse_articles
+            from data_handler import save_to_excel
+            
+            self._emit_progress(10, f"Fetching {self.source} page...")
             
             if self.source == "kaggle":
                 # For Kaggle, we don't need to fetch HTML content in the same way
-                self.progress.emit(40, f"Parsing {self.source} dataset...", self.source)
+                self._emit_progress(40, f"Parsing {self.source} dataset...")
                 articles_data = enhanced_parse_articles(None, self.source, self.get_full_content, self.url)
             else:
                 html_content = fetch_page_content(self.url)
@@ -51,36 +56,72 @@ class ScrapingWorker(QThread):
                     self.error.emit(f"Failed to fetch page content from {self.source}", self.source)
                     return
                     
-                self.progress.emit(40, f"Parsing {self.source} articles...", self.source)
+                self._emit_progress(40, f"Parsing {self.source} articles...")
                 articles_data = enhanced_parse_articles(html_content, self.source, self.get_full_content)
             
             if articles_data:
-                self.progress.emit(70, f"Saving {self.source} data to Excel...", self.source)
-                # Create a temporary file first to avoid permission issues
-                temp_dir = tempfile.gettempdir()
+                self._emit_progress(70, f"Saving {self.source} data to Excel...")
+                # Write a temporary file next to the target first, so the final
+                # os.replace is a same-filesystem rename that swaps the file atomically
+                temp_dir = os.path.dirname(os.path.abspath(self.output_file))
                 temp_file = os.path.join(temp_dir, f"temp_news_{self.source}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx")
                 
-                save_to_excel(articles_data, temp_file)
-                
                 # Try to move the temp file to the desired location
+                backup_file = None
                 try:
+                    save_to_excel(articles_data, temp_file)
+                    
                     if os.path.exists(self.output_file):
                         # Backup the existing file
                         backup_file = self.output_file.replace('.xlsx', f'_backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx')
-                        shutil.move(self.output_file, backup_file)
+                        os.replace(self.output_file, backup_file)
                     
-                    shutil.move(temp_file, self.output_file)
-                    self.finished.emit({"articles": articles_data, "file": self.output_file}, self.source)
+                    try:
+                        os.replace(temp_file, self.output_file)
+                    except OSError:
+                        # Put the previous file back rather than leave no output file at all
+                        if backup_file:
+                            os.replace(backup_file, self.output_file)
+                        raise
+                    self.scraped.emit({"articles": articles_data, "file": self.output_file}, self.source)
                 except PermissionError:
                     self.error.emit(f"Permission denied when trying to save to {self.output_file}. The file might be open in another program.", self.source)
                 except Exception as e:
                     self.error.emit(f"Error saving file: {str(e)}", self.source)
+                finally:
+                    # Only left behind when saving failed; don't let them pile up in the data directory
+                    if os.path.exists(temp_file):
+                        try:
+                            os.remove(temp_file)
+                        except OSError:
+                            pass
             else:
                 self.error.emit(f"No data was found from {self.source}", self.source)
                 
         except Exception as e:
             self.error.emit(f"An unexpected error occurred: {str(e)}", self.source)
 
+class WorkerMonitor(QObject):
+    """Receives the workers' queued signals in the manager thread and passes them on"""
+    
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+    
+    def on_worker_finished(self, result, source):
+        self.manager.on_worker_finished(result, source)
+        self.manager.on_worker_done(self.sender())
+    
+    def on_worker_error(self, error_message, source):
+        self.manager.on_worker_error(error_message, source)
+        self.manager.on_worker_done(self.sender())
+    
+    def on_worker_progress(self, progress, message, source):
+        self.manager.on_worker_progress(progress, message, source)
+    
+    def on_worker_ended(self):
+        self.manager.on_worker_done(self.sender())
+
 class ScrapingManager(QThread):
     """Manager thread that coordinates multiple scraping workers"""
     finished = pyqtSignal(list)
@@ -95,25 +136,33 @@ class ScrapingManager(QThread):
         self.get_full_content = get_full_content
         self.workers = []
         self.results = {}
-        self.lock = threading.Lock()
+        self.done_workers = set()
         
     def run(self):
         try:
             self.progress.emit(0, "Starting scraping process...")
             
+            # Created here, so it lives in this thread: worker signals are queued to
+            # the event loop started below and results are only touched in this thread
+            monitor = WorkerMonitor(self)
+            
             # Create worker threads for each source
             for url, output_file in zip(self.urls, self.output_files):
                 worker = ScrapingWorker(url, output_file, self.get_full_content)
-                worker.finished.connect(self.on_worker_finished)
-                worker.error.connect(self.on_worker_error)
-                worker.progress.connect(self.on_worker_progress)
+                worker.scraped.connect(monitor.on_worker_finished, Qt.QueuedConnection)
+                worker.error.connect(monitor.on_worker_error, Qt.QueuedConnection)
+                worker.progress.connect(monitor.on_worker_progress, Qt.QueuedConnection)
+                # A worker whose thread ends without reporting must not stall the manager
+                worker.finished.connect(monitor.on_worker_ended, Qt.QueuedConnection)
                 self.workers.append(worker)
             
             # Start all workers
             for worker in self.workers:
                 worker.start()
             
-            # Wait for all workers to finish
+            # Process worker signals until every worker has reported back
+            if self.workers:
+                self.exec_()
             for worker in self.workers:
                 worker.wait()
                 
@@ -135,17 +184,23 @@ class ScrapingManager(QThread):
             self.error.emit(f"An unexpected error occurred: {str(e)}")
     
     def on_worker_finished(self, result, source):
-        with self.lock:
-            self.results[source] = result
-            completed = len(self.results)
-            total = len(self.workers)
-            progress = int((completed / total) * 100)
-            self.progress.emit(progress, f"Completed {source} scraping")
+        self.results[source] = result
+        completed = len(self.results)
+        total = len(self.workers)
+        progress = int((completed / total) * 100)
+        self.progress.emit(progress, f"Completed {source} scraping")
     
     def on_worker_error(self, error_message, source):
         self.source_progress.emit(0, f"Error: {error_message}", source)
         # We don't emit the main error signal here to allow other sources to continue
     
+    def on_worker_done(self, worker):
+        """Stop the manager's event loop once every worker has reported or ended"""
+        # A worker both reports and ends, so count each one only once
+        self.done_workers.add(worker)
+        if len(self.done_workers) >= len(self.workers):
+            self.quit()
+    
     def on_worker_progress(self, progress, message, source):
         self.source_progress.emit(progress, message, source)
 
@@ -559,6 +614,149 @@ class ArticleDetailWindow(QMainWindow):
         except RuntimeError as e:
             print(f"Error going back: {e}")
             self.close()
+
+# Main window style sheet, applied once in SereniTruthApp.init_ui. Container
+# rules also cover their nested frames (QLabel and QListWidget are QFrames).
+# Within one sheet the more specific selector wins, so each nested widget's rule
+# names its container too, letting it override the container's descendant rule
+# the way its own per-widget sheet used to.
+APP_STYLE = """
+    QMainWindow {
+        background-color: #E8FFE8;
+    }
+    QFrame#main_container, QFrame#main_container QFrame {
+        background-color: rgba(13, 86, 0, 76);
+        border: 2px solid #0D5600;
+        border-radius: 10px;
+        padding: 20px;
+    }
+    QFrame#main_container QFrame#prediction_frame, QFrame#prediction_frame QFrame,
+    QFrame#main_container QFrame#detection_header, QFrame#detection_header QFrame {
+        background-color: #0D5600;
+        border-radius: 10px;
+        padding: 15px;
+    }
+    QFrame#main_container QFrame#left_container_1, QFrame#left_container_1 QFrame {
+        background-color: #5CA74E;
+        border-radius: 10px;
+        padding: 15px;
+    }
+    QFrame#main_container QFrame#left_container_2, QFrame#left_container_2 QFrame {
+        background-color: #D5F5D4;
+        border: 2px solid #0D5600;
+        border-radius: 10px;
+        padding: 15px;
+    }
+    QLabel#logo_label {
+        background: transparent;
+        margin-right: 20px;
+    }
+    QLineEdit#search_bar {
+        background-color: white;
+        border: 2px solid #ddd;
+        border-radius: 25px;
+        padding: 12px 20px;
+        font-size: 16px;
+        min-width: 300px;
+    }
+    QLineEdit#search_bar:focus {
+        border-color: #2196F3;
+    }
+    QPushButton#refresh_btn {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 10px 15px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#refresh_btn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#refresh_btn:disabled {
+        background-color: #cccccc;
+    }
+    QFrame#prediction_frame QLabel#prediction_title,
+    QFrame#detection_header QLabel#articles_title {
+        color: #FFFFFF;
+        font-size: 18px;
+        font-weight: bold;
+        text-align: center;
+        padding: 10px;
+    }
+    QPushButton#all_btn, QPushButton#trusted_btn {
+        background-color: #237914;
+        color: #FFFFFF;
+        border: none;
+        border-radius: 10px;
+        padding: 15px;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton#all_btn:hover, QPushButton#trusted_btn:hover {
+        background-color: #1e6611;
+    }
+    QPushButton#all_btn:pressed, QPushButton#trusted_btn:pressed {
+        background-color: #1a5a0f;
+    }
+    QPushButton#fake_btn {
+        background-color: #d32f2f;
+        color: #FFFFFF;
+        border: none;
+        border-radius: 10px;
+        padding: 15px;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton#fake_btn:hover {
+        background-color: #c62828;
+    }
+    QPushButton#fake_btn:pressed {
+        background-color: #b71c1c;
+    }
+    QFrame#left_container_2 QLabel#status_title {
+        color: #000000;
+        font-size: 18px;
+        font-weight: bold;
+        text-align: center;
+        padding: 10px;
+        border-bottom: 2px solid #0D5600;
+        margin-bottom: 15px;
+    }
+    QFrame#left_container_2 QLabel#status_text {
+        color: #000000;
+        font-size: 14px;
+        text-align: center;
+        padding: 15px;
+        line-height: 1.4;
+        border: 1px solid #0D5600;
+        border-radius: 10px;
+        background-color: white;
+    }
+    QFrame#main_container QListWidget#articles_list {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        font-size: 14px;
+    }
+    QListWidget#articles_list::item {
+        padding: 15px;
+        border-bottom: 1px solid #eee;
+    }
+    QListWidget#articles_list::item:selected {
+        background-color: #E8F5E8;
+        color: #0D5600;
+        font-weight: bold;
+    }
+    QListWidget#articles_list::item:hover {
+        background-color: #f0f8f0;
+    }
+    QLabel#footer_label {
+        color: #888;
+        font-size: 10px;
+    }
+"""
+
 class SereniTruthApp(QMainWindow):
     def __init__(self, articles_data, urls, excel_files):
         super().__init__()
@@ -568,14 +766,10 @@ class SereniTruthApp(QMainWindow):
         self.article_windows = []  # Track open article windows
         self.current_filter = "all"  # Track current filter: "all", "fake", "real"
         self.selected_article = None  # Track currently selected article
+        self.loading = False  # Articles are still being loaded in the background
         
         self.setWindowTitle("SereniTruth - Fake Article Detector")
         self.setFixedSize(1440, 900)  # Desktop size
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #E8FFE8;
-            }
-        """)
         
         self.init_ui()
         self.display_articles()
@@ -590,6 +784,9 @@ class SereniTruthApp(QMainWindow):
         self.main_layout.setContentsMargins(40, 30, 40, 30)
         self.main_layout.setSpacing(20)
         
+        # One style sheet for the whole window; widgets are matched by object name
+        self.setStyleSheet(APP_STYLE)
+        
         # Create UI elements
         self.create_header()
         self.create_main_container()
@@ -619,7 +816,7 @@ class SereniTruthApp(QMainWindow):
         logo_label.setFixedHeight(60)
         logo_label.setFixedWidth(190)   # para square container
         logo_label.setAlignment(Qt.AlignCenter)  # gitna ng container ang image
-        logo_label.setStyleSheet("background: transparent; margin-right: 20px;")
+        logo_label.setObjectName("logo_label")
 
         logo_title_layout.addWidget(logo_label)
         logo_title_layout.addStretch()
@@ -627,39 +824,12 @@ class SereniTruthApp(QMainWindow):
         # Search bar
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search articles...")
-        self.search_bar.setStyleSheet("""
-            QLineEdit {
-                background-color: white;
-                border: 2px solid #ddd;
-                border-radius: 25px;
-                padding: 12px 20px;
-                font-size: 16px;
-                min-width: 300px;
-            }
-            QLineEdit:focus {
-                border-color: #2196F3;
-            }
-        """)
+        self.search_bar.setObjectName("search_bar")
         self.search_bar.textChanged.connect(self.filter_articles)
         
         # Refresh button
         self.refresh_btn = QPushButton('🔄 Scrape New Data')
-        self.refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 10px 15px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.refresh_btn.setObjectName("refresh_btn")
         self.refresh_btn.clicked.connect(self.start_scraping)
         
         header_layout.addLayout(logo_title_layout)
@@ -671,14 +841,7 @@ class SereniTruthApp(QMainWindow):
     def create_main_container(self):
         # Main container
         main_container = QFrame()
-        main_container.setStyleSheet("""
-            QFrame {
-                background-color: rgba(13, 86, 0, 76);
-                border: 2px solid #0D5600;
-                border-radius: 10px;
-                padding: 20px;
-            }
-        """)
+        main_container.setObjectName("main_container")
         
         main_container_layout = QHBoxLayout(main_container)
         main_container_layout.setSpacing(20)
@@ -697,101 +860,33 @@ class SereniTruthApp(QMainWindow):
         
         # Prediction section
         prediction_frame = QFrame()
-        prediction_frame.setStyleSheet("""
-            QFrame {
-                background-color: #0D5600;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        prediction_frame.setObjectName("prediction_frame")
         prediction_layout = QVBoxLayout(prediction_frame)
         
         prediction_title = QLabel("FILTER ARTICLES")
-        prediction_title.setStyleSheet("""
-            QLabel {
-                color: #FFFFFF;
-                font-size: 18px;
-                font-weight: bold;
-                text-align: center;
-                padding: 10px;
-            }
-        """)
+        prediction_title.setObjectName("prediction_title")
         prediction_title.setAlignment(Qt.AlignCenter)
         prediction_layout.addWidget(prediction_title)
         
         # Buttons container
         left_container_1 = QFrame()
-        left_container_1.setStyleSheet("""
-            QFrame {
-                background-color: #5CA74E;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        left_container_1.setObjectName("left_container_1")
         buttons_layout = QVBoxLayout(left_container_1)
         buttons_layout.setSpacing(10)
         
         # Show All Articles Button
         self.all_btn = QPushButton("ALL ARTICLES")
-        self.all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #237914;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 10px;
-                padding: 15px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1e6611;
-            }
-            QPushButton:pressed {
-                background-color: #1a5a0f;
-            }
-        """)
+        self.all_btn.setObjectName("all_btn")
         self.all_btn.clicked.connect(self.show_all_articles)
         
         # Fake Article Button
         self.fake_btn = QPushButton("FAKE ARTICLES")
-        self.fake_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #d32f2f;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 10px;
-                padding: 15px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c62828;
-            }
-            QPushButton:pressed {
-                background-color: #b71c1c;
-            }
-        """)
+        self.fake_btn.setObjectName("fake_btn")
         self.fake_btn.clicked.connect(self.show_fake_articles)
         
         # Trusted Article Button
         self.trusted_btn = QPushButton("TRUSTED ARTICLES")
-        self.trusted_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #237914;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 10px;
-                padding: 15px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1e6611;
-            }
-            QPushButton:pressed {
-                background-color: #1a5a0f;
-            }
-        """)
+        self.trusted_btn.setObjectName("trusted_btn")
         self.trusted_btn.clicked.connect(self.show_trusted_articles)
         
         buttons_layout.addWidget(self.all_btn)
@@ -800,43 +895,15 @@ class SereniTruthApp(QMainWindow):
         
         # Status container
         left_container_2 = QFrame()
-        left_container_2.setStyleSheet("""
-            QFrame {
-                background-color: #D5F5D4;
-                border: 2px solid #0D5600;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        left_container_2.setObjectName("left_container_2")
         status_layout = QVBoxLayout(left_container_2)
         
         status_title = QLabel("SELECTED ARTICLE")
-        status_title.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 18px;
-                font-weight: bold;
-                text-align: center;
-                padding: 10px;
-                border-bottom: 2px solid #0D5600;
-                margin-bottom: 15px;
-            }
-        """)
+        status_title.setObjectName("status_title")
         status_title.setAlignment(Qt.AlignCenter)
         
         self.status_text = QLabel("Click on an article to see its detection status and content preview.")
-        self.status_text.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 14px;
-                text-align: center;
-                padding: 15px;
-                line-height: 1.4;
-                border: 1px solid #0D5600;
-                border-radius: 10px;
-                background-color: white;
-            }
-        """)
+        self.status_text.setObjectName("status_text")
         self.status_text.setAlignment(Qt.AlignCenter)
         self.status_text.setWordWrap(True)
         
@@ -855,52 +922,21 @@ class SereniTruthApp(QMainWindow):
         
         # Detection output header
         detection_header = QFrame()
-        detection_header.setStyleSheet("""
-            QFrame {
-                background-color: #0D5600;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        detection_header.setObjectName("detection_header")
         detection_header_layout = QVBoxLayout(detection_header)
         
         self.articles_title = QLabel("ALL ARTICLES")
-        self.articles_title.setStyleSheet("""
-            QLabel {
-                color: #FFFFFF;
-                font-size: 18px;
-                font-weight: bold;
-                text-align: center;
-                padding: 10px;
-            }
-        """)
+        self.articles_title.setObjectName("articles_title")
         self.articles_title.setAlignment(Qt.AlignCenter)
         detection_header_layout.addWidget(self.articles_title)
         
         # Articles list
         self.articles_list = QListWidget()
+        # All rows are single-line, so let Qt lay out one row instead of measuring each
+        self.articles_list.setUniformItemSizes(True)
         self.articles_list.itemClicked.connect(self.on_article_selected)  # Single click to select
         self.articles_list.itemDoubleClicked.connect(self.show_article_details)  # Double click to view details
-        self.articles_list.setStyleSheet("""
-            QListWidget {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QListWidget::item {
-                padding: 15px;
-                border-bottom: 1px solid #eee;
-            }
-            QListWidget::item:selected {
-                background-color: #E8F5E8;
-                color: #0D5600;
-                font-weight: bold;
-            }
-            QListWidget::item:hover {
-                background-color: #f0f8f0;
-            }
-        """)
+        self.articles_list.setObjectName("articles_list")
         
         right_layout.addWidget(detection_header)
         right_layout.addWidget(self.articles_list)
@@ -911,7 +947,7 @@ class SereniTruthApp(QMainWindow):
         # Footer
         footer_text = f'Data will be saved to: {", ".join([os.path.basename(f) for f in self.excel_files])}'
         footer_label = QLabel(footer_text)
-        footer_label.setStyleSheet("color: #888; font-size: 10px;")
+        footer_label.setObjectName("footer_label")
         self.main_layout.addWidget(footer_label)
 
     def display_articles(self):
@@ -919,7 +955,10 @@ class SereniTruthApp(QMainWindow):
         self.articles_list.clear()
         
         if not self.articles_data:
-            self.articles_list.addItem("No articles available. Click 'Scrape New Data' to fetch articles.")
+            if self.loading:
+                self.articles_list.addItem("Loading articles...")
+            else:
+                self.articles_list.addItem("No articles available. Click 'Scrape New Data' to fetch articles.")
             return
         
         # Enhanced filtering: Filter articles based on current filter AND remove articles with invalid titles
@@ -953,7 +992,8 @@ class SereniTruthApp(QMainWindow):
                             if search_text in article.get('Title', '').lower() or 
                             search_text in article.get('Fake_News_Label', '').lower()]
         
-        # Add filtered articles to the list
+        # Add filtered articles to the list, repainting once at the end
+        self.articles_list.setUpdatesEnabled(False)
         for article in filtered_articles:
             status = article.get('Fake_News_Label', '❓ UNKNOWN')
             
@@ -961,6 +1001,7 @@ class SereniTruthApp(QMainWindow):
             item = QListWidgetItem(title)
             item.setData(Qt.UserRole, article)
             self.articles_list.addItem(item)
+        self.articles_list.setUpdatesEnabled(True)
         
         # Update status
         if filtered_articles:
@@ -971,6 +1012,16 @@ class SereniTruthApp(QMainWindow):
             filter_text = self.current_filter.upper() if self.current_filter != "all" else "ALL"
             self.articles_title.setText(f"{filter_text} ARTICLES (0)")
         
+    def add_articles(self, new_articles):
+        """Append newly classified articles (e.g. from a background scrape) to the list"""
+        self.articles_data.extend(new_articles)
+        self.display_articles()
+    
+    def set_loading(self, loading):
+        """Show a loading message instead of the empty-list text while articles are loaded"""
+        self.loading = loading
+        self.display_articles()
+        
     def on_article_selected(self, item):
         """Handle article selection to show details in status panel"""
         self.selected_article = item.data(Qt.UserRole)
@@ -19,6 +19,9 @@ warnings.filterwarnings("ignore", message="numpy.ufunc size changed")
 warnings.filterwarnings("ignore", category=UserWarning)
 
 import sys
+import queue
+import threading
+import time
 import pandas as pd
 from PyQt5.QtWidgets import QApplication, QMessageBox
 from PyQt5.QtCore import QThread, pyqtSignal
@@ -26,94 +29,28 @@ from PyQt5.QtCore import QThread, pyqtSignal
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from interface.user_interface import SereniTruthApp
-from scraper import fetch_page_content, enhanced_parse_articles
-from data_handler import save_to_excel, load_excel_data, load_csv_data, print_preview
 
-def main():
-    app = QApplication(sys.argv)
-    app.setStyle('Fusion')
-    
-    # URLs to scrape (only NPR now)
-    npr_tech_url = "https://www.npr.org/sections/technology/"
-    
-    # Create a dedicated data directory for the application
-    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-    os.makedirs(data_dir, exist_ok=True)
-    
-    # Create separate Excel files for each source
-    npr_excel_file = os.path.join(data_dir, "npr_articles.xlsx")
-    csv_file_path = os.path.join(data_dir, "WELFake_Dataset.csv")
-    excel_files = [npr_excel_file, csv_file_path]
-    
-    # Load data from both Excel files
-    articles_data = []
-    
-    # Load NPR data from Excel if exists
-    try:
-        npr_data = load_excel_data(npr_excel_file)
-        if npr_data:
-            articles_data.extend(npr_data)
-            print(f"✅ Loaded {len(npr_data)} articles from NPR Excel file")
-    except Exception as e:
-        print(f"Error loading NPR Excel file: {e}")
-    
-    # Load CSV data directly
-    try:
-        csv_data = load_csv_data(csv_file_path)
-        if csv_data:
-            articles_data.extend(csv_data)
-            print(f"✅ Loaded {len(csv_data)} articles from CSV file")
-        else:
-            print("❌ No data was loaded from CSV file")
-    except Exception as e:
-        print(f"Error loading CSV file: {e}")
-    
-    # If no NPR data was loaded from Excel, scrape fresh data
-    npr_count = len([article for article in articles_data if article.get('Source') == 'NPR'])
-    if npr_count == 0:
-        print("Scraping fresh data from NPR...")
-        npr_html = fetch_page_content(npr_tech_url)
-        if npr_html:
-            npr_articles = enhanced_parse_articles(npr_html, "npr", get_full_content=True)
-            if npr_articles:
-                articles_data.extend(npr_articles)
-                print(f"✅ Scraped {len(npr_articles)} articles from NPR")
-                save_to_excel(npr_articles, npr_excel_file)
-            else:
-                print("❌ No articles were scraped from NPR.")
-        else:
-            print("❌ Failed to fetch content from NPR.")
-    
-    # Enhanced filtering: Remove articles with no title or invalid titles
-    valid_articles = []
-    invalid_count = 0
-    
-    for article in articles_data:
-        title = article.get('Title', '')
-        # Check for various invalid title conditions
-        if (title and 
-            title != 'No title' and 
-            title != 'No title found' and 
-            title.strip() != '' and
-            title != 'Title not found' and
-            title != 'Access Denied' and
-            title != 'Error retrieving title'):
-            valid_articles.append(article)
-        else:
-            invalid_count += 1
-            print(f"⚠️ Skipping article with invalid title: '{title}'")
-    
-    articles_data = valid_articles
-    print(f"✅ Filtered to {len(articles_data)} valid articles (removed {invalid_count} invalid)")
-    
-    # Run fake news detection on all loaded articles - with enhanced error handling
+# Placeholder titles left by the scraper when a title could not be read
+INVALID_TITLES = frozenset({
+    'No title',
+    'No title found',
+    'Title not found',
+    'Access Denied',
+    'Error retrieving title',
+})
+
+def filter_valid_articles(articles_data):
+    """Remove articles with no title or invalid titles; returns (valid_articles, invalid_count)"""
+    valid_articles = [
+        article for article in articles_data
+        if (title := article.get('Title', '')) and title.strip() and title not in INVALID_TITLES
+    ]
+    return valid_articles, len(articles_data) - len(valid_articles)
+
+def classify_articles(articles_data):
+    """Run fake news detection on the articles - with enhanced error handling"""
     try:
-        # Import numpy first with error suppression (redundant but safe)
-        import numpy as np
-        import warnings
-        warnings.filterwarnings("ignore", message="numpy.dtype size changed")
-        warnings.filterwarnings("ignore", message="numpy.ufunc size changed")
-        
+        # The classifier (and scikit-learn with it) is only imported once articles need it
         from naive_bayes_classifier import detect_fake_news_with_nb
         articles_data = detect_fake_news_with_nb(articles_data)
         print("✅ Fake news detection completed successfully")
@@ -137,9 +74,208 @@ def main():
             article['Fake_Probability'] = 0.5
             article['Real_Probability'] = 0.5
             article['Confidence'] = 0.5
+    return articles_data
+
+class InterruptibleWorker(QThread):
+    """Worker thread whose slow steps can be abandoned when the app is closing"""
     
-    # Pass the data to the UI (using only NPR URL since CSV is loaded directly)
-    window = SereniTruthApp(articles_data, [npr_tech_url], excel_files)
+    POLL_INTERVAL = 0.2  # seconds between checks for an interruption request
+    
+    def call_interruptibly(self, func, *args):
+        """Call func in a daemon thread, returning None early if interruption is requested.
+        
+        Quitting waits on this thread, so a slow step (a download, loading or training
+        the model) must not hold it up; exceptions from func are re-raised here.
+        """
+        outcome = {}
+        
+        def target():
+            try:
+                outcome['result'] = func(*args)
+            except BaseException as e:
+                outcome['error'] = e
+        
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        while thread.is_alive():
+            thread.join(self.POLL_INTERVAL)
+            if self.isInterruptionRequested():
+                return None
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('result')
+
+class CachedArticlesWorker(InterruptibleWorker):
+    """Load and classify the saved NPR and CSV articles without blocking the window"""
+    articles_ready = pyqtSignal(list)  # classified articles
+    
+    def __init__(self, npr_excel_file, csv_file_path):
+        super().__init__()
+        self.npr_excel_file = npr_excel_file
+        self.csv_file_path = csv_file_path
+        self.npr_count = 0  # NPR articles found in the Excel file
+    
+    def run(self):
+        from data_handler import load_excel_data, load_csv_data
+        
+        # Load data from both Excel files
+        articles_data = []
+        
+        # Load NPR data from Excel if exists
+        try:
+            npr_data = self.call_interruptibly(load_excel_data, self.npr_excel_file)
+            if self.isInterruptionRequested():
+                return
+            if npr_data:
+                articles_data.extend(npr_data)
+                print(f"✅ Loaded {len(npr_data)} articles from NPR Excel file")
+        except Exception as e:
+            print(f"Error loading NPR Excel file: {e}")
+        
+        # Load CSV data directly
+        try:
+            csv_data = self.call_interruptibly(load_csv_data, self.csv_file_path)
+            if self.isInterruptionRequested():
+                return
+            if csv_data:
+                articles_data.extend(csv_data)
+                print(f"✅ Loaded {len(csv_data)} articles from CSV file")
+            else:
+                print("❌ No data was loaded from CSV file")
+        except Exception as e:
+            print(f"Error loading CSV file: {e}")
+        
+        self.npr_count = len([article for article in articles_data if article.get('Source') == 'NPR'])
+        
+        # Enhanced filtering: Remove articles with no title or invalid titles
+        articles_data, invalid_count = filter_valid_articles(articles_data)
+        print(f"✅ Filtered to {len(articles_data)} valid articles (removed {invalid_count} invalid)")
+        
+        # Run fake news detection on all loaded articles; loading (or training) the
+        # model can take a while, so don't make quitting wait for it
+        articles_data = self.call_interruptibly(classify_articles, articles_data)
+        if self.isInterruptionRequested():
+            return
+        self.articles_ready.emit(articles_data)
+
+class NprScrapeWorker(InterruptibleWorker):
+    """Scrape NPR in the background, classifying articles in batches as their pages arrive"""
+    articles_ready = pyqtSignal(list)  # newly classified articles
+    
+    BATCH_SIZE = 32  # most articles classified at once
+    BATCH_WAIT = 0.2  # seconds to wait for more articles once a batch has started
+    FETCH_WORKERS = 8  # article pages downloaded concurrently
+    
+    def __init__(self, url, output_file):
+        super().__init__()
+        self.url = url
+        self.output_file = output_file
+    
+    def run(self):
+        # Imported here so requests/BeautifulSoup only load once a scrape is needed
+        from scraper import fetch_page_content, parse_articles, has_article_url, add_full_content
+        from data_handler import save_to_excel
+        
+        print("Scraping fresh data from NPR...")
+        # Fetching retries with long timeouts, so don't let it hold up closing the app
+        npr_html = self.call_interruptibly(fetch_page_content, self.url)
+        if self.isInterruptionRequested():
+            return
+        if not npr_html:
+            print("❌ Failed to fetch content from NPR.")
+            return
+        
+        npr_articles = parse_articles(npr_html, "npr")
+        if not npr_articles:
+            print("❌ No articles were scraped from NPR.")
+            return
+        
+        # Producers: fetch threads download article pages (network bound, so the GIL
+        # is released) and queue each article; this thread consumes them in batches
+        pending = queue.Queue()
+        fetched = queue.Queue()
+        for article in npr_articles:
+            if has_article_url(article):
+                pending.put(article)
+            else:
+                fetched.put(article)
+        
+        def fetch():
+            # Stop taking new pages once the app is closing
+            while not self.isInterruptionRequested():
+                try:
+                    article = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    add_full_content(article, "npr")
+                finally:
+                    fetched.put(article)
+        
+        # Daemon threads, so a page still downloading never keeps the app from exiting
+        for _ in range(min(self.FETCH_WORKERS, pending.qsize())):
+            threading.Thread(target=fetch, daemon=True).start()
+        
+        scraped = []
+        remaining = len(npr_articles)
+        while remaining:
+            batch = self.next_batch(fetched, remaining)
+            if not batch:
+                break  # Application is closing
+            remaining -= len(batch)
+            # Keep the scraped fields only for the Excel file, as before detection
+            scraped.extend(dict(article) for article in batch)
+            
+            batch, _ = filter_valid_articles(batch)
+            if batch:
+                self.articles_ready.emit(classify_articles(batch))
+        
+        if remaining:
+            return
+        print(f"✅ Scraped {len(scraped)} articles from NPR")
+        save_to_excel(scraped, self.output_file)
+    
+    def next_batch(self, fetched, remaining):
+        """Wait for the next fetched article, then gather more for up to BATCH_WAIT seconds"""
+        while True:
+            try:
+                batch = [fetched.get(timeout=self.BATCH_WAIT)]
+                break
+            except queue.Empty:
+                if self.isInterruptionRequested():
+                    return []
+        
+        deadline = time.monotonic() + self.BATCH_WAIT
+        while len(batch) < min(self.BATCH_SIZE, remaining):
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(fetched.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+def main():
+    app = QApplication(sys.argv)
+    app.setStyle('Fusion')
+    
+    # URLs to scrape (only NPR now)
+    npr_tech_url = "https://www.npr.org/sections/technology/"
+    
+    # Create a dedicated data directory for the application
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+    os.makedirs(data_dir, exist_ok=True)
+    
+    # Create separate Excel files for each source
+    npr_excel_file = os.path.join(data_dir, "npr_articles.xlsx")
+    csv_file_path = os.path.join(data_dir, "WELFake_Dataset.csv")
+    excel_files = [npr_excel_file, csv_file_path]
+    
+    # Show the window straight away (using only NPR URL since CSV is loaded directly);
+    # saved articles are loaded and classified in the background and added as they are ready
+    window = SereniTruthApp([], [npr_tech_url], excel_files)
+    window.set_loading(True)
     window.show()
     
     # Center the window on screen
@@ -149,7 +285,25 @@ def main():
         (screen.height() - window.height()) // 2
     )
     
+    loader = CachedArticlesWorker(npr_excel_file, csv_file_path)
+    loader.articles_ready.connect(window.add_articles)
+    loader.finished.connect(lambda: window.set_loading(False))
+    npr_worker = NprScrapeWorker(npr_tech_url, npr_excel_file)
+    npr_worker.articles_ready.connect(window.add_articles)
+    
+    # If no NPR data was loaded from Excel, scrape fresh data in the background;
+    # the window is updated batch by batch
+    def start_npr_scrape():
+        if loader.npr_count == 0 and not loader.isInterruptionRequested():
+            npr_worker.start()
+    loader.finished.connect(start_npr_scrape)
+    
+    for worker in (loader, npr_worker):
+        app.aboutToQuit.connect(worker.requestInterruption)
+        app.aboutToQuit.connect(worker.wait)
+    loader.start()
+    
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,59 +1,177 @@
 # naive_bayes_classifier.py
+import functools
+import heapq
+import json
 import math
 import re
 import os
-from collections import defaultdict, Counter
+import shutil
+import string
+from collections import Counter
+import numpy as np
 import pandas as pd
-import joblib
-from sklearn.feature_extraction.text import CountVectorizer
+
+# Words that negate the rest of their clause (up to the next punctuation mark)
+_NEGATION_RE = re.compile(r"\b(?:not|no|never|none|n't|don't|doesn't|didn't|isn't|aren't|wasn't|weren't|haven't|hasn't|hadn't|won't|wouldn't|shouldn't|couldn't|can't|cannot)\b")
+_PUNCTUATION_RE = re.compile(r"[.,!?;:]")
+_NON_WORD_RE = re.compile(r"[^a-z_]+")
+# Same as _NON_WORD_RE for ASCII text, but str.translate needs no regex engine
+_ASCII_NON_WORD = str.maketrans({c: " " for c in map(chr, range(128)) if c not in string.ascii_lowercase + "_"})
+
+def _words(text):
+    """Split lowercased text into words made of a-z and underscores"""
+    if text.isascii():
+        return text.translate(_ASCII_NON_WORD).split()
+    return _NON_WORD_RE.sub(" ", text).split()
+
+def _is_missing(value):
+    """Cheap stand-in for pd.isna on a single value: None, NaN or an empty string"""
+    return value is None or (isinstance(value, float) and value != value) or value == ''
+
+def _tokenize(text):
+    """Preprocess text: lowercase, remove punctuation, handle negation"""
+    # Handle NaN and None values
+    if not isinstance(text, str):
+        return []
+        
+    # Convert to lowercase
+    text = text.lower()
+    
+    # Negation never crosses punctuation, so each clause is handled on its own:
+    # words after the first negation in a clause get a NOT_ prefix
+    tokens = []
+    for clause in _PUNCTUATION_RE.split(text):
+        match = _NEGATION_RE.search(clause)
+        if match is None:
+            tokens.extend(_words(clause))
+        else:
+            tokens.extend(_words(clause[:match.end()]))
+            tokens.extend("NOT_" + word for word in _words(clause[match.end():]))
+    
+    return tokens
+
+# Longest text kept in the token cache: titles and teasers repeat across articles,
+# but article bodies rarely do and would pin megabytes of tokens in the cache
+_CACHE_MAX_CHARS = 500
+
+@functools.lru_cache(maxsize=4096)
+def _preprocess_cached(text):
+    return tuple(_tokenize(text))
+
+def _preprocess(text):
+    """_tokenize as a tuple, so callers can't change cached tokens; short texts are cached"""
+    if isinstance(text, str) and len(text) > _CACHE_MAX_CHARS:
+        return tuple(_tokenize(text))
+    return _preprocess_cached(text)
 
 class NaiveBayesClassifier:
-    def __init__(self, alpha=1.0, use_ngrams=False):
+    def __init__(self, alpha=1.0, use_ngrams=False, use_hashing=False, n_features=2 ** 18,
+                 min_df=1, max_df=1.0, max_features=None):
         self.alpha = alpha  # Laplace smoothing parameter
         self.class_priors = {}
-        self.word_likelihoods = {}
-        self.vocab = set()
+        self.classes = []  # class labels, in the row order of log_lik
+        self.log_prior = np.empty(0)  # log P(class), per class
+        self.log_lik = np.empty((0, 0), dtype=np.float32)  # log P(feature | class), one row per class
+        self.vocab_index = {}  # feature -> column in log_lik (empty when hashing)
+        self.unknown_log_lik = np.empty(0)  # smoothed log P(unseen word | class), per class
+        self._feature_names = np.array([], dtype=object)  # column -> feature
+        self._log_ratio = None  # log_lik[1] - log_lik[0] for binary models, built on first use
         self.is_trained = False
         self.use_ngrams = use_ngrams
-        self.vectorizer = CountVectorizer(ngram_range=(1, 2) if use_ngrams else (1, 1))
+        self.use_hashing = use_hashing
+        # scikit-learn is imported on first use so importing this module stays cheap
+        from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
+        if use_hashing:
+            # Hash features straight to n_features columns: nothing to fit and no
+            # vocabulary to store, at the cost of readable feature names
+            self.vectorizer = HashingVectorizer(
+                n_features=n_features,
+                analyzer='word' if use_ngrams else _preprocess,
+                ngram_range=(1, 2) if use_ngrams else (1, 1),
+                norm=None,
+                alternate_sign=False,
+            )
+        elif use_ngrams:
+            self.vectorizer = CountVectorizer(ngram_range=(1, 2), min_df=min_df, max_df=max_df,
+                                              max_features=max_features, dtype=np.int32)
+        else:
+            # Count the same negation-aware tokens that preprocess_text produces
+            self.vectorizer = CountVectorizer(analyzer=_preprocess, min_df=min_df, max_df=max_df,
+                                              max_features=max_features, dtype=np.int32)
+    
+    def __getstate__(self):
+        # Feature names are rebuilt from the vectorizer on load rather than pickled twice,
+        # and the binary likelihood ratio on first use
+        state = self.__dict__.copy()
+        state.pop('_feature_names', None)
+        state.pop('_log_ratio', None)
+        return state
+    
+    def __setstate__(self, state):
+        """Restore a pickled classifier, upgrading models saved with per-word likelihood dicts"""
+        self.__dict__.update(state)
+        self.__dict__.setdefault('use_hashing', False)
+        self._log_ratio = None
+        # Older models also kept the vocabulary as a set; vocab_index replaces it
+        vocab = self.__dict__.pop('vocab', set())
+        word_likelihoods = self.__dict__.pop('word_likelihoods', None)
+        if word_likelihoods is not None:
+            self._upgrade_likelihoods(word_likelihoods, vocab)
+        if 'log_prior' not in self.__dict__:
+            self.log_prior = np.log([self.class_priors[label] for label in self.classes])
+        if self.is_trained and not self.use_hashing:
+            self._feature_names = self.vectorizer.get_feature_names_out()
+        else:
+            self._feature_names = np.array([], dtype=object)
+    
+    def _upgrade_likelihoods(self, word_likelihoods, vocab):
+        """Convert per-word likelihood dicts from older models into log-likelihood arrays"""
+        if self.use_ngrams:
+            self.vocab_index = self.vectorizer.vocabulary_ if self.is_trained else {}
+        else:
+            # Older unigram models kept an unfitted vectorizer next to their vocab
+            from sklearn.feature_extraction.text import CountVectorizer
+            self.vocab_index = {word: i for i, word in enumerate(sorted(vocab))}
+            self.vectorizer = CountVectorizer(analyzer=_preprocess, vocabulary=self.vocab_index or None)
+        
+        words = sorted(self.vocab_index, key=self.vocab_index.get)
+        self.classes = list(self.class_priors)
+        self.log_lik = np.empty((len(self.classes), len(words)), dtype=np.float32)
+        for i, label in enumerate(self.classes):
+            likelihoods = word_likelihoods[label]
+            self.log_lik[i] = np.log(np.fromiter((likelihoods[word] for word in words), dtype=np.float64, count=len(words)))
+        # Class totals were not saved; the least likely word is one never seen
+        # in the class, whose likelihood is exactly the unknown-word likelihood
+        self.unknown_log_lik = self.log_lik.min(axis=1).astype(np.float64) if words else np.zeros(len(self.classes))
+        self._log_ratio = None
         
     def preprocess_text(self, text):
         """Preprocess text: lowercase, remove punctuation, handle negation"""
-        # Handle NaN and None values
-        if not isinstance(text, str) or pd.isna(text):
-            return []
-            
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Handle negation by adding NOT_ prefix to words after negation until punctuation
-        negation_patterns = [
-            r"\b(not|no|never|none|n't|don't|doesn't|didn't|isn't|aren't|wasn't|weren't|haven't|hasn't|hadn't|won't|wouldn't|shouldn't|couldn't|can't|cannot)\b"
-        ]
-        
-        # Find negation phrases
-        for pattern in negation_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                # Find the next punctuation after the negation
-                punctuation_match = re.search(r"[.,!?;:]", text[match.end():])
-                if punctuation_match:
-                    end_pos = match.end() + punctuation_match.start()
-                else:
-                    end_pos = len(text)
-                
-                # Add NOT_ prefix to all words between negation and punctuation
-                words_to_negate = text[match.end():end_pos].split()
-                negated_words = ["NOT_" + word for word in words_to_negate]
-                text = text[:match.end()] + " " + " ".join(negated_words) + text[end_pos:]
-        
-        # Remove special characters and digits, keep only words
-        text = re.sub(r"[^a-zNOT_]", " ", text)
-        
-        # Tokenize
-        tokens = text.split()
-        
-        return tokens
+        return _preprocess(text)
+    
+    def _feature_ids(self, features):
+        """Columns of log_lik for the features, -1 for those outside the vocabulary"""
+        if not self.use_hashing:
+            return np.fromiter((self.vocab_index.get(feature, -1) for feature in features), dtype=np.int64, count=len(features))
+        if not features:
+            return np.empty(0, dtype=np.int64)
+        # Hash each feature on its own row, the way the vectorizer hashes them
+        from sklearn.feature_extraction import FeatureHasher
+        hasher = FeatureHasher(n_features=self.vectorizer.n_features, input_type='string', alternate_sign=False)
+        return hasher.transform([[feature] for feature in features]).indices.astype(np.int64)
+    
+    def _count_tokens(self, tokens_per_doc):
+        """Document-term counts of tokenized documents, plus each document's unknown-token count"""
+        from scipy.sparse import csr_matrix
+        lengths = np.fromiter(map(len, tokens_per_doc), dtype=np.intp, count=len(tokens_per_doc))
+        ids = self._feature_ids([token for tokens in tokens_per_doc for token in tokens])
+        doc_index = np.repeat(np.arange(len(tokens_per_doc)), lengths)
+        known = ids >= 0
+        # Repeated (document, feature) pairs are summed when converting to CSR
+        X = csr_matrix((np.ones(np.count_nonzero(known), dtype=np.int32), (doc_index[known], ids[known])),
+                       shape=(len(tokens_per_doc), self.log_lik.shape[1]))
+        unknown_counts = np.bincount(doc_index[~known], minlength=len(tokens_per_doc))
+        return X, unknown_counts
     
     def train(self, documents, labels):
         """Train the Naive Bayes classifier"""
@@ -67,131 +185,252 @@ class NaiveBayesClassifier:
         # Calculate class priors
         self.class_priors = {cls: count / total_documents for cls, count in class_counts.items()}
         
-        # If using n-grams, fit the vectorizer
-        if self.use_ngrams:
-            self.vectorizer.fit(documents)
-            self.vocab = set(self.vectorizer.get_feature_names_out())
-        
-        # Count words per class
-        word_counts = defaultdict(lambda: defaultdict(int))
-        
-        for doc, label in zip(documents, labels):
-            if self.use_ngrams:
-                # Use vectorizer for n-grams
-                bow = self.vectorizer.transform([doc]).toarray()[0]
-                feature_names = self.vectorizer.get_feature_names_out()
-                for i, count in enumerate(bow):
-                    if count > 0:
-                        word = feature_names[i]
-                        word_counts[label][word] += count
-                        self.vocab.add(word)
-            else:
-                # Use traditional tokenization
-                tokens = self.preprocess_text(doc)
-                for token in tokens:
-                    word_counts[label][token] += 1
-                    self.vocab.add(token)
+        # Count features for all documents at once as a sparse document-term matrix
+        X = self.vectorizer.fit_transform(documents)
+        if not self.use_hashing:
+            self.vocab_index = self.vectorizer.vocabulary_
+            self._feature_names = self.vectorizer.get_feature_names_out()
         
-        # Calculate word likelihoods with Laplace smoothing
-        vocab_size = len(self.vocab)
-        self.word_likelihoods = {}
-        
-        for label in class_counts:
-            total_words_in_class = sum(word_counts[label].values())
-            self.word_likelihoods[label] = {}
-            
-            for word in self.vocab:
-                count = word_counts[label].get(word, 0)
-                # Laplace smoothing
-                self.word_likelihoods[label][word] = (count + self.alpha) / (total_words_in_class + self.alpha * vocab_size)
+        # Calculate word log-likelihoods with Laplace smoothing, one row per class,
+        # directly in log space: log(count + alpha) - log(total + alpha * V)
+        vocab_size = X.shape[1]
+        self.classes = list(class_counts)
+        self.log_prior = np.log([self.class_priors[label] for label in self.classes])
+        # Per-class feature counts in one sparse product: one-hot (class x document) @ X
+        from scipy.sparse import csr_matrix
+        class_index = {label: i for i, label in enumerate(self.classes)}
+        rows = np.fromiter((class_index[label] for label in labels), dtype=np.intp, count=len(labels))
+        one_hot = csr_matrix((np.ones(len(rows), dtype=X.dtype), (rows, np.arange(len(rows)))),
+                             shape=(len(self.classes), X.shape[0]))
+        word_counts = (one_hot @ X).toarray()
+        log_totals = np.log(word_counts.sum(axis=1) + self.alpha * vocab_size)
+        self.log_lik = (np.log(word_counts + self.alpha) - log_totals[:, None]).astype(np.float32)
+        self.unknown_log_lik = math.log(self.alpha) - log_totals
+        self._log_ratio = None
         
         self.is_trained = True
         return self
     
     def predict(self, document, return_details=False):
         """Predict the class of a document with optional feature contributions"""
+        # Score it as a one-document batch: a sparse matrix product instead of a loop
+        # over tokens and classes (predict_batch also handles empty documents)
+        return self.predict_batch([document], return_details)[0]
+    
+    def _predict_binary(self, X):
+        """Log-odds of the second class for each row of X in a two-class model.
+        
+        Scores against one likelihood-ratio vector instead of both rows of log_lik.
+        """
+        if self._log_ratio is None:
+            self._log_ratio = self.log_lik[1] - self.log_lik[0]
+        return np.asarray(X @ self._log_ratio).ravel() + (self.log_prior[1] - self.log_prior[0])
+    
+    def predict_batch(self, documents, return_details=False):
+        """Predict the classes of many documents with one sparse matrix product"""
         if not self.is_trained:
             raise ValueError("Classifier not trained. Please train first.")
-            
-        # Handle NaN and empty documents
-        if not document or pd.isna(document) or str(document).strip() == '':
-            # Return equal probability for both classes if document is empty
-            if return_details:
-                return 0, {0: 0.5, 1: 0.5}, {}
-            return 0, {0: 0.5, 1: 0.5}
-            
-        if self.use_ngrams:
-            # Use vectorizer for n-grams
-            bow = self.vectorizer.transform([document]).toarray()[0]
-            feature_names = self.vectorizer.get_feature_names_out()
-            tokens = [feature_names[i] for i, count in enumerate(bow) if count > 0]
-        else:
-            # Use traditional tokenization
-            tokens = self.preprocess_text(document)
         
-        # Calculate log probabilities for each class
-        log_probs = {}
-        feature_contributions = {}
+        # Empty documents get equal probabilities, as in predict
+        texts = ['' if not doc or _is_missing(doc) or str(doc).strip() == '' else doc for doc in documents]
         
-        for label in self.class_priors:
-            # Start with log of class prior
-            log_probs[label] = math.log(self.class_priors[label])
-            feature_contributions[label] = {}
-            
-            # Add log likelihoods for each word
-            for token in tokens:
-                if token in self.word_likelihoods[label]:
-                    token_prob = self.word_likelihoods[label][token]
-                    log_probs[label] += math.log(token_prob)
-                    feature_contributions[label][token] = math.log(token_prob)
-                else:
-                    # Handle unknown words with Laplace smoothing
-                    vocab_size = len(self.vocab)
-                    total_words_in_class = sum(self.word_likelihoods[label].values())
-                    unknown_prob = self.alpha / (total_words_in_class + self.alpha * vocab_size)
-                    log_probs[label] += math.log(unknown_prob)
-                    feature_contributions[label][token] = math.log(unknown_prob)
+        # Score each distinct text once; duplicates share its result
+        positions = {}
+        inverse = [positions.setdefault(text, len(positions)) for text in texts]
+        texts = list(positions)
+        is_empty = [text == '' for text in texts]
         
-        # Find the class with the highest probability
-        predicted_class = max(log_probs.items(), key=lambda x: x[1])[0]
+        labels = self.classes
+        log_likelihoods = self.log_lik
         
-        # Convert log probabilities back to regular probabilities
-        # Using the log-sum-exp trick to avoid underflow
-        max_log_prob = max(log_probs.values())
-        exp_sum = sum(math.exp(log_prob - max_log_prob) for log_prob in log_probs.values())
+        unknown_log_probs = self.unknown_log_lik
+        tokens_per_doc = None
+        unknown_counts = None
+        if not self.use_ngrams and not self.use_hashing:
+            # Tokenize each text once: the same tokens give the counts and the number of
+            # unknown words, whose smoothed likelihood is added back below
+            tokens_per_doc = [self.preprocess_text(text) for text in texts]
+            X, unknown_counts = self._count_tokens(tokens_per_doc)
+        else:
+            X = self.vectorizer.transform(texts)
+            if self.use_ngrams:
+                # N-grams count once per document, matching predict
+                X.data[:] = 1
         
-        probabilities = {}
-        for label, log_prob in log_probs.items():
-            probabilities[label] = math.exp(log_prob - max_log_prob) / exp_sum
+        if return_details and self.use_hashing and self.use_ngrams:
+            analyze = self.vectorizer.build_analyzer()
+        
+        if len(labels) == 2:
+            # Binary fast path: P(second class) is the sigmoid of the log-odds
+            from scipy.special import expit
+            delta = self._predict_binary(X)
+            if unknown_counts is not None:
+                delta += unknown_counts * (unknown_log_probs[1] - unknown_log_probs[0])
+            probs = np.column_stack([expit(-delta), expit(delta)])
+            predicted = (delta > 0).astype(np.intp)
+        else:
+            # Score every document against every class: (n_docs, n_classes)
+            log_probs = np.asarray(X @ log_likelihoods.T) + self.log_prior
+            if unknown_counts is not None:
+                log_probs += np.outer(unknown_counts, unknown_log_probs)
+            # Convert log probabilities back to regular probabilities with log-sum-exp
+            probs = np.exp(log_probs - log_probs.max(axis=1, keepdims=True))
+            probs /= probs.sum(axis=1, keepdims=True)
+            predicted = log_probs.argmax(axis=1)
+        
+        results = []
+        for i, empty in enumerate(is_empty):
+            if empty:
+                results.append((0, {0: 0.5, 1: 0.5}, {}) if return_details else (0, {0: 0.5, 1: 0.5}))
+                continue
+            
+            predicted_class = labels[predicted[i]]
+            probabilities = {label: float(probs[i, j]) for j, label in enumerate(labels)}
+            if not return_details:
+                results.append((predicted_class, probabilities))
+                continue
+            
+            # Contributions of the features present in this document, per class
+            if self.use_ngrams and not self.use_hashing:
+                # Read the row's feature ids straight from the CSR arrays instead of slicing X[i]
+                indices = X.indices[X.indptr[i]:X.indptr[i + 1]]
+                tokens = self._feature_names[indices]
+                feature_contributions = {
+                    label: dict(zip(tokens, log_likelihoods[j, indices].tolist()))
+                    for j, label in enumerate(labels)
+                }
+            else:
+                # Look each token up once, then gather its log-likelihood for every class;
+                # hashed features have no names, so re-analyze the text for them
+                if self.use_ngrams:
+                    tokens = list(dict.fromkeys(analyze(texts[i])))
+                elif tokens_per_doc is not None:
+                    tokens = tokens_per_doc[i]
+                else:
+                    tokens = self.preprocess_text(texts[i])
+                ids = self._feature_ids(tokens)
+                scores = np.where(ids >= 0, log_likelihoods[:, ids], unknown_log_probs[:, None]).tolist()
+                feature_contributions = {
+                    label: dict(zip(tokens, scores[j]))
+                    for j, label in enumerate(labels)
+                }
+            results.append((predicted_class, probabilities, feature_contributions))
         
-        if return_details:
-            return predicted_class, probabilities, feature_contributions
-        return predicted_class, probabilities
+        return [results[i] for i in inverse]
     
     def evaluate(self, test_documents, test_labels):
         """Evaluate the classifier on test data"""
         if len(test_documents) != len(test_labels):
             raise ValueError("Test documents and labels must have the same length")
             
-        correct = 0
-        predictions = []
-        
-        for doc, true_label in zip(test_documents, test_labels):
-            pred_label, _ = self.predict(doc)
-            predictions.append(pred_label)
-            if pred_label == true_label:
-                correct += 1
+        # Score the whole test set in one batch
+        predictions = [pred_label for pred_label, _ in self.predict_batch(test_documents)]
+        correct = sum(pred_label == true_label for pred_label, true_label in zip(predictions, test_labels))
         
         accuracy = correct / len(test_documents)
         return accuracy, predictions
 
+    def save(self, directory):
+        """Save the model as plain files: .npy arrays, which load memory-mapped, and JSON for the rest"""
+        if not self.is_trained:
+            raise ValueError("Classifier not trained. Please train first.")
+        
+        # Write everything into a fresh sibling directory that then replaces the old one,
+        # so files from two different saves are never mixed, even after a crash
+        directory = os.path.normpath(directory)
+        tmp_dir = directory + ".tmp"
+        old_dir = directory + ".old"
+        for leftover in (tmp_dir, old_dir):
+            shutil.rmtree(leftover, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        
+        np.save(os.path.join(tmp_dir, "log_lik.npy"), np.ascontiguousarray(self.log_lik, dtype=np.float32))
+        np.save(os.path.join(tmp_dir, "log_prior.npy"), self.log_prior)
+        np.save(os.path.join(tmp_dir, "unknown_log_lik.npy"), self.unknown_log_lik)
+        
+        # Labels may be NumPy integers, which JSON cannot store
+        classes = [label.item() if isinstance(label, np.generic) else label for label in self.classes]
+        model_info = {
+            "alpha": self.alpha,
+            "use_ngrams": self.use_ngrams,
+            "use_hashing": self.use_hashing,
+            "n_features": self.vectorizer.n_features if self.use_hashing else None,
+            "classes": classes,
+            "class_priors": [self.class_priors[label] for label in self.classes],
+            "terms": self._feature_names.tolist(),  # feature of each log_lik column
+        }
+        with open(os.path.join(tmp_dir, "model.json"), "w", encoding="utf-8") as f:
+            json.dump(model_info, f)
+        
+        # Directories can't be replaced in one rename, so the old one is moved aside first;
+        # a crash in between leaves no directory, and load_classifier uses the pickle
+        if os.path.exists(directory):
+            os.replace(directory, old_dir)
+        os.replace(tmp_dir, directory)
+        shutil.rmtree(old_dir, ignore_errors=True)
+    
+    @classmethod
+    def load(cls, directory):
+        """Load a model written by save; the log-likelihood matrix is memory-mapped, not copied"""
+        with open(os.path.join(directory, "model.json"), encoding="utf-8") as f:
+            model_info = json.load(f)
+        
+        classifier = cls(alpha=model_info["alpha"], use_ngrams=model_info["use_ngrams"],
+                         use_hashing=model_info["use_hashing"], n_features=model_info["n_features"] or 2 ** 18)
+        classifier.classes = model_info["classes"]
+        classifier.class_priors = dict(zip(classifier.classes, model_info["class_priors"]))
+        classifier.log_lik = np.load(os.path.join(directory, "log_lik.npy"), mmap_mode='r')
+        classifier.log_prior = np.load(os.path.join(directory, "log_prior.npy"))
+        classifier.unknown_log_lik = np.load(os.path.join(directory, "unknown_log_lik.npy"))
+        
+        if not classifier.use_hashing:
+            # A vectorizer with a fixed vocabulary needs no real fitting
+            terms = model_info["terms"]
+            classifier.vectorizer.set_params(vocabulary={term: i for i, term in enumerate(terms)})
+            classifier.vectorizer.fit([])
+            classifier.vocab_index = classifier.vectorizer.vocabulary_
+            classifier._feature_names = np.array(terms, dtype=object)
+        
+        classifier.is_trained = True
+        return classifier
+
+def write_atomic(path, write):
+    """Write a file through write(f) into a temporary file, then move it over path.
+    
+    A crash part-way through leaves the previous file intact instead of a truncated one.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 # Function to load and prepare training data from CSV
 def load_training_data(csv_filepath, text_column="text", label_column="label", max_samples=None):
     """Load training data from CSV file"""
     if not os.path.exists(csv_filepath):
         raise FileNotFoundError(f"CSV file not found: {csv_filepath}")
     
-    df = pd.read_csv(csv_filepath)
+    # Only parse the two columns used for training; the rest of the file is skipped.
+    # pyarrow's CSV reader parses blocks on several threads when it is installed;
+    # otherwise (or if it cannot parse the file) use pandas' default C engine
+    columns = [text_column, label_column]
+    try:
+        import pyarrow.csv as pacsv
+        table = pacsv.read_csv(
+            csv_filepath,
+            # Article text can contain quoted newlines
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            # Empty text is missing, as with pandas, so dropna removes it
+            convert_options=pacsv.ConvertOptions(include_columns=columns, strings_can_be_null=True),
+        )
+        df = table.to_pandas()
+    except Exception:
+        df = pd.read_csv(csv_filepath, usecols=columns)
     
     # Handle missing values
     df = df.dropna(subset=[text_column, label_column])
@@ -205,104 +444,166 @@ def load_training_data(csv_filepath, text_column="text", label_column="label", m
 
 def get_top_features(feature_contributions, predicted_class, top_n=10):
     """Get the top features that contributed to the prediction"""
-    features = {}
-    for feature, contribution in feature_contributions[predicted_class].items():
-        features[feature] = contribution
+    # Take the top N by absolute contribution without sorting every feature;
+    # ties keep their original order, as with a stable sort
+    top_features = heapq.nlargest(top_n, feature_contributions[predicted_class].items(), key=lambda x: abs(x[1]))
+    return dict(top_features)
+
+def load_classifier(model_path="models/naive_bayes_classifier.pkl", use_ngrams=True):
+    """Load the saved classifier, training one from CSV if needed; None if neither works.
     
-    # Sort by absolute contribution and take top N
-    sorted_features = sorted(features.items(), key=lambda x: abs(x[1]), reverse=True)[:top_n]
-    return dict(sorted_features)
+    The result is cached, so callers that classify articles in batches load the model once.
+    A failure is not cached: the next call tries again.
+    """
+    classifier = _load_classifier(model_path, use_ngrams)
+    if classifier is None:
+        _load_classifier.cache_clear()
+    return classifier
 
-# Function to integrate with the main application
-def detect_fake_news_with_nb(articles_data, model_path="models/naive_bayes_classifier.pkl", use_ngrams=True):
-    """Detect fake news using Naive Bayes classifier with detailed computation info"""
-    # Try to load existing model
+@functools.lru_cache(maxsize=None)
+def _load_classifier(model_path, use_ngrams):
+    """Cached body of load_classifier"""
+    import joblib
+    
+    # Try to load existing model; its likelihood arrays are memory-mapped, not copied.
+    # The split files saved next to the pickle (see save) load fastest, so prefer them,
+    # but only if they were written after the pickle: a directory left over from a
+    # failed re-save, or a pickle replaced on its own, must not shadow a newer pickle
+    split_dir = os.path.splitext(model_path)[0]
+    split_info = os.path.join(split_dir, "model.json")
+    if os.path.exists(split_info) and (not os.path.exists(model_path)
+                                       or os.path.getmtime(split_info) >= os.path.getmtime(model_path)):
+        try:
+            classifier = NaiveBayesClassifier.load(split_dir)
+            print("✅ Loaded pre-trained Naive Bayes model")
+            return classifier
+        except Exception as e:
+            print(f"❌ Could not load model from {split_dir}: {e}. Trying {model_path}...")
     try:
-        classifier = joblib.load(model_path)
+        classifier = joblib.load(model_path, mmap_mode='r')
         print("✅ Loaded pre-trained Naive Bayes model")
     except:
         print("❌ No pre-trained model found. Training new model...")
-        # Try to train from CSV data
-        csv_path = "data/WELFake_Dataset.csv"
-        if os.path.exists(csv_path):
-            try:
-                # Load training data
-                documents, labels = load_training_data(
-                    csv_path, 
-                    text_column="text",  # Using text content for training
-                    label_column="label",
-                    max_samples=1000  # Reduced to 1000 samples for faster training
-                )
-                
-                # Train classifier with enhanced features
-                classifier = NaiveBayesClassifier(alpha=1.0, use_ngrams=use_ngrams)
-                classifier.train(documents, labels)
-                
-                # Save the model
-                os.makedirs(os.path.dirname(model_path), exist_ok=True)
-                joblib.dump(classifier, model_path)
-                print("✅ Model trained successfully with enhanced features")
-            except Exception as e:
-                print(f"❌ Error training model: {e}")
-                return articles_data
-        else:
-            print("❌ Could not train model - CSV file not found")
-            return articles_data
+    else:
+        # Write the split files once, so later starts load them instead of the pickle
+        # (which, for older models, also has to be upgraded on every load)
+        try:
+            classifier.save(split_dir)
+        except Exception as e:
+            print(f"⚠️ Could not save the model as split files: {e}")
+        return classifier
+    
+    # Try to train from CSV data
+    csv_path = "data/WELFake_Dataset.csv"
+    if not os.path.exists(csv_path):
+        print("❌ Could not train model - CSV file not found")
+        return None
     
-    # Analyze each article
+    try:
+        # Load training data
+        documents, labels = load_training_data(
+            csv_path, 
+            text_column="text",  # Using text content for training
+            label_column="label",
+            max_samples=1000  # Reduced to 1000 samples for faster training
+        )
+        
+        # Train classifier with enhanced features
+        classifier = NaiveBayesClassifier(alpha=1.0, use_ngrams=use_ngrams)
+        classifier.train(documents, labels)
+        
+        # Save the model uncompressed so later loads can memory-map it
+        os.makedirs(os.path.dirname(model_path), exist_ok=True)
+        write_atomic(model_path, lambda f: joblib.dump(classifier, f, protocol=5))
+        print("✅ Model trained successfully with enhanced features")
+        return classifier
+    except Exception as e:
+        print(f"❌ Error training model: {e}")
+        return None
+
+# Results for articles that are not scored by the classifier
+_NO_CONTENT_RESULT = {
+    'Prediction': 'Unknown',
+    'Fake_Probability': 0.5,
+    'Real_Probability': 0.5,
+    'Confidence': 0.5,
+    'Fake_News_Label': '❓ NO CONTENT',
+    'Model_Used': 'N/A - No content',
+}
+_ANALYSIS_FAILED_RESULT = {
+    'Prediction': 'Unknown',
+    'Fake_Probability': 0.5,
+    'Real_Probability': 0.5,
+    'Confidence': 0.5,
+    'Fake_News_Label': '❓ ANALYSIS FAILED',
+    'Model_Used': 'Error - Could not analyze',
+}
+
+# Function to integrate with the main application
+def detect_fake_news_with_nb(articles_data, model_path="models/naive_bayes_classifier.pkl", use_ngrams=True):
+    """Detect fake news using Naive Bayes classifier with detailed computation info"""
+    classifier = load_classifier(model_path, use_ngrams)
+    if classifier is None:
+        return articles_data
+    
+    to_analyze = []
     for article in articles_data:
+        # Rows from the training dataset already have a true label; predicting them
+        # would only echo the training data back, so show the label instead
+        if article.get('_from_training') and article.get('Label') in (0, 1):
+            is_fake = article['Label'] == 1
+            article.update({
+                'Prediction': 'Fake' if is_fake else 'Real',
+                'Fake_Probability': 1.0 if is_fake else 0.0,
+                'Real_Probability': 0.0 if is_fake else 1.0,
+                'Confidence': 1.0,
+                'Fake_News_Label': '⚠️ FAKE (DATASET LABEL)' if is_fake else '✅ REAL (DATASET LABEL)',
+                'Model_Used': 'N/A - Label from training dataset',
+                'Key_Features': {},
+            })
+            continue
+        
         # Use full content if available, otherwise use title and teaser
-        if 'Full Content' in article and article['Full Content'] and pd.notna(article['Full Content']):
+        if 'Full Content' in article and article['Full Content'] and not _is_missing(article['Full Content']):
             text = article['Full Content']
-        elif 'Content Paragraphs' in article and article['Content Paragraphs'] and pd.notna(article['Content Paragraphs']):
+        elif 'Content Paragraphs' in article and article['Content Paragraphs'] and not _is_missing(article['Content Paragraphs']):
             text = article['Content Paragraphs']
         else:
             text = str(article['Title']) + ' ' + str(article.get('Teaser', ''))
         
         # Skip if text is empty or NaN
-        if not text or pd.isna(text) or text == 'nan' or text.strip() == '':
+        if not text or _is_missing(text) or text == 'nan' or text.strip() == '':
             print(f"⚠️ Skipping article with empty content: {article['Title']}")
             # Add default values if text is empty
-            article['Prediction'] = 'Unknown'
-            article['Fake_Probability'] = 0.5
-            article['Real_Probability'] = 0.5
-            article['Confidence'] = 0.5
-            article['Fake_News_Label'] = '❓ NO CONTENT'
-            article['Model_Used'] = 'N/A - No content'
-            article['Key_Features'] = {}
-            continue
-            
-        try:
-            prediction, probabilities, feature_contributions = classifier.predict(text, return_details=True)
-            
-            # Add predictions to article with detailed computation info
-            article['Prediction'] = 'Fake' if prediction == 1 else 'Real'
-            article['Fake_Probability'] = probabilities.get(1, 0.5)
-            article['Real_Probability'] = probabilities.get(0, 0.5)
-            article['Confidence'] = max(probabilities.values())
-            
-            # Set a label for display
-            if prediction == 1:
-                article['Fake_News_Label'] = '⚠️ POTENTIALLY FAKE'
-            else:
-                article['Fake_News_Label'] = '✅ LIKELY REAL'
-            
-            # Add model info for computation details
-            article['Model_Used'] = 'Enhanced Naive Bayes with N-grams' if use_ngrams else 'Standard Naive Bayes'
-            
-            # Extract key features that contributed to the decision
-            article['Key_Features'] = get_top_features(feature_contributions, prediction, top_n=10)
-                
-        except Exception as e:
-            print(f"❌ Error predicting article: {e}")
-            # Add default values if prediction fails
-            article['Prediction'] = 'Unknown'
-            article['Fake_Probability'] = 0.5
-            article['Real_Probability'] = 0.5
-            article['Confidence'] = 0.5
-            article['Fake_News_Label'] = '❓ ANALYSIS FAILED'
-            article['Model_Used'] = 'Error - Could not analyze'
-            article['Key_Features'] = {}
+            article.update(_NO_CONTENT_RESULT, Key_Features={})
+        else:
+            to_analyze.append((article, text))
+    
+    # Score all remaining articles in one batch
+    try:
+        results = classifier.predict_batch([text for _, text in to_analyze], return_details=True)
+    except Exception as e:
+        print(f"❌ Error predicting articles: {e}")
+        # Add default values if prediction fails
+        for article, _ in to_analyze:
+            article.update(_ANALYSIS_FAILED_RESULT, Key_Features={})
+        results = []
+    
+    # Scatter the batch results back onto the articles, one update per article
+    model_used = 'Enhanced Naive Bayes with N-grams' if use_ngrams else 'Standard Naive Bayes'
+    for (article, _), (prediction, probabilities, feature_contributions) in zip(to_analyze, results):
+        is_fake = prediction == 1
+        article.update({
+            'Prediction': 'Fake' if is_fake else 'Real',
+            'Fake_Probability': probabilities.get(1, 0.5),
+            'Real_Probability': probabilities.get(0, 0.5),
+            'Confidence': max(probabilities.values()),
+            # Label for display
+            'Fake_News_Label': '⚠️ POTENTIALLY FAKE' if is_fake else '✅ LIKELY REAL',
+            'Model_Used': model_used,
+            # Key features that contributed to the decision
+            'Key_Features': get_top_features(feature_contributions, prediction, top_n=10),
+        })
     
     print(f"✅ Successfully analyzed {len(articles_data)} articles with Enhanced Naive Bayes")
     return articles_data
\ No newline at end of file
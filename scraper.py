@@ -1,9 +1,66 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import time
 import re
-from urllib.parse import urljoin
+import threading
+from urllib.parse import urljoin, urlparse
 import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# lxml builds the tree several times faster than the pure-Python parser;
+# fall back to html.parser when it is not installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# One session for all requests so repeated fetches from the same host reuse
+# keep-alive connections instead of opening a new TCP/TLS connection each time.
+# Retries stay in the fetch functions below, so the adapter does not add its own.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.headers.update({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+})
+
+# Patterns used while extracting article pages, built once rather than per article
+_HEADLINE_RE = re.compile(r'headline|title', re.I)
+_SKIP_PHRASES = ('sign up', 'subscribe', 'newsletter', 'advertisement')  # ads and navigation text
+
+# Block pages say so near the top; only this many leading bytes are searched, so
+# large pages are not decoded and lowercased (and articles that merely mention
+# "blocked" further down are not mistaken for block pages)
+_BLOCKED_CHECK_BYTES = 4096
+
+def _is_blocked(response):
+    """Whether the response looks like an access-denied page rather than content"""
+    head = response.content[:_BLOCKED_CHECK_BYTES].lower()
+    return b"access denied" in head or b"blocked" in head
+
+# Requests to the same host start at least this many seconds apart, even when
+# several threads are fetching; replaces the sleep after each sequential fetch
+HOST_REQUEST_INTERVAL = 1.0
+_HOST_LOCK = threading.Lock()
+_next_request_time = {}  # host -> earliest time.monotonic() for its next request
+
+def _wait_for_host(url):
+    """Block until the politeness interval for the URL's host allows another request"""
+    host = urlparse(url).netloc
+    with _HOST_LOCK:
+        now = time.monotonic()
+        start = max(now, _next_request_time.get(host, now))
+        _next_request_time[host] = start + HOST_REQUEST_INTERVAL
+    # Sleep outside the lock so other hosts are not held up
+    time.sleep(start - now)
 
 def fetch_page_content(url, max_retries=3):
     """Fetch the HTML content of a webpage with retry mechanism"""
@@ -18,23 +75,17 @@ def fetch_page_content(url, max_retries=3):
                 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15'
             ]
             
-            headers = {
-                'User-Agent': random.choice(user_agents),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
+            # The remaining headers are set once on the shared session
+            headers = {'User-Agent': random.choice(user_agents)}
             
             print(f"Fetching news from: {url} (Attempt {attempt + 1}/{max_retries})")
+            _wait_for_host(url)
             # Increase timeout to 30 seconds
-            response = requests.get(url, headers=headers, timeout=30)
+            response = _SESSION.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             
             # Check if we got a valid HTML response (not a blocked page)
-            if "access denied" in response.text.lower() or "blocked" in response.text.lower():
+            if _is_blocked(response):
                 print(f"❌ Access denied by {url}. They might be blocking scrapers.")
                 return None
                 
@@ -56,7 +107,7 @@ def parse_npr_articles(html_content, base_url="https://www.npr.org"):
     if not html_content:
         return []
         
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, HTML_PARSER)
     print("NPR page fetched successfully. Parsing content...")
     
     # Find all article containers on NPR
@@ -139,22 +190,16 @@ def get_article_full_content(url, source, max_retries=2):
                 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0'
             ]
             
-            headers = {
-                'User-Agent': random.choice(user_agents),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
+            # The remaining headers are set once on the shared session
+            headers = {'User-Agent': random.choice(user_agents)}
             
             print(f"Fetching full article from {source}: {url} (Attempt {attempt + 1}/{max_retries})")
-            response = requests.get(url, headers=headers, timeout=25)
+            _wait_for_host(url)
+            response = _SESSION.get(url, headers=headers, timeout=(5, 25))  # (connect, read)
             response.raise_for_status()
             
             # Check if we got blocked
-            if "access denied" in response.text.lower() or "blocked" in response.text.lower():
+            if _is_blocked(response):
                 print(f"❌ Access denied when trying to fetch full article from {url}")
                 return {
                     'title': "Access Denied",
@@ -164,12 +209,12 @@ def get_article_full_content(url, source, max_retries=2):
                     'article_date': "Date not available"
                 }
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Extract the article title
             title_elem = (soup.find('h1') or soup.find('h2', class_='title') or
                          soup.find('h1', attrs={'data-qa': 'headline'}) or
-                         soup.find('h1', class_=re.compile(r'headline|title', re.I)))
+                         soup.find('h1', class_=_HEADLINE_RE))
             article_title = title_elem.get_text(strip=True) if title_elem else "Title not found"
             
             # Extract full article content - different selectors for different sources
@@ -181,7 +226,6 @@ def get_article_full_content(url, source, max_retries=2):
             else:
                 content_div = soup.find('article') or soup.find('div', class_='content')
             
-            full_content = ""
             content_paragraphs = []
             
             if content_div:
@@ -189,11 +233,11 @@ def get_article_full_content(url, source, max_retries=2):
                 paragraphs = content_div.find_all('p')
                 for p in paragraphs:
                     text = p.get_text(strip=True)
+                    lowered = text.lower()
                     # Skip very short paragraphs (likely ads or metadata) and navigation text
                     if (text and len(text) > 20 and 
-                        not any(x in text.lower() for x in ['sign up', 'subscribe', 'newsletter', 'advertisement'])):
+                        not any(phrase in lowered for phrase in _SKIP_PHRASES)):
                         content_paragraphs.append(text)
-                        full_content += text + "\n\n"
             
             # Extract images if available
             images = []
@@ -223,7 +267,7 @@ def get_article_full_content(url, source, max_retries=2):
             
             return {
                 'title': article_title,
-                'full_content': full_content.strip(),
+                'full_content': "\n\n".join(content_paragraphs),
                 'paragraphs': content_paragraphs,
                 'images': images,
                 'article_date': article_date
@@ -243,26 +287,42 @@ def get_article_full_content(url, source, max_retries=2):
                     'article_date': "Date not available"
                 }
 
-def enhanced_parse_articles(html_content, source, get_full_content=True, base_url=None):
+def has_article_url(article):
+    """Whether a parsed article has a page that full content can be fetched from"""
+    return bool(article['Article URL']) and article['Article URL'] != "URL not found"
+
+def add_full_content(article, source):
+    """Fetch an article's page and add all the extracted content to the article data"""
+    full_content_data = get_article_full_content(article['Article URL'], source)
+    
+    article['Full Content'] = full_content_data['full_content']
+    article['Content Paragraphs'] = "\n\n".join(full_content_data['paragraphs'])
+    article['Paragraph Count'] = len(full_content_data['paragraphs'])
+    article['Image URLs'] = ", ".join(full_content_data['images'])
+    article['Image Count'] = len(full_content_data['images'])
+    article['Detailed Date'] = full_content_data['article_date']
+    return article
+
+def enhanced_parse_articles(html_content, source, get_full_content=True, base_url=None, max_workers=16):
     """Enhanced parsing with option to get full article content"""
     basic_data = parse_articles(html_content, source, base_url)
     
     if get_full_content and basic_data:
         print(f"Fetching full content for {len(basic_data)} {source} articles...")
-        for i, article in enumerate(basic_data):
-            if article['Article URL'] and article['Article URL'] != "URL not found":
-                full_content_data = get_article_full_content(article['Article URL'], source)
-                
-                # Add all the extracted content to the article data
-                article['Full Content'] = full_content_data['full_content']
-                article['Content Paragraphs'] = "\n\n".join(full_content_data['paragraphs'])
-                article['Paragraph Count'] = len(full_content_data['paragraphs'])
-                article['Image URLs'] = ", ".join(full_content_data['images'])
-                article['Image Count'] = len(full_content_data['images'])
-                article['Detailed Date'] = full_content_data['article_date']
-                
+        to_fetch = [article for article in basic_data if has_article_url(article)]
+        
+        # Downloads are I/O bound, so pool threads overlap them; each thread also
+        # parses its page, pipelining parsing with the other downloads
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(add_full_content, article, source): article for article in to_fetch}
+            for i, future in enumerate(as_completed(futures)):
+                title = futures[future]['Title']
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Error fetching full content for {source} article '{title}': {e}")
+                    continue
                 # Update progress
-                print(f"Fetched {i+1}/{len(basic_data)} articles from {source} - {article['Title']}")
-                time.sleep(1)  # Increased delay to avoid being blocked
+                print(f"Fetched {i+1}/{len(to_fetch)} articles from {source} - {title}")
     
     return basic_data
\ No newline at end of file
@@ -7,73 +7,132 @@ with n-grams features
 
 import sys
 import os
+import argparse
 
 # Add the current directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from naive_bayes_classifier import NaiveBayesClassifier, load_training_data
+from naive_bayes_classifier import NaiveBayesClassifier, load_training_data, write_atomic
 import joblib
+from joblib import Parallel, delayed
 
-def main():
+def fit_classifier(config, documents, labels):
+    """Train one classifier configuration; runs in a worker process"""
+    classifier = NaiveBayesClassifier(alpha=1.0, **config)
+    return classifier.train(documents, labels)
+
+def parse_args(argv=None):
+    """Parse the command line options"""
+    parser = argparse.ArgumentParser(description="Train the Naive Bayes fake news classifier")
+    parser.add_argument("--force", action="store_true",
+                        help="retrain even if the saved model is newer than the training data")
+    parser.add_argument("--demo", action="store_true",
+                        help="also train a unigram model and compare both on sample texts")
+    parser.add_argument("--hashing", action="store_true",
+                        help="hash n-gram features instead of building a vocabulary")
+    return parser.parse_args(argv)
+
+def run_demo(classifier_std, classifier_ngrams):
+    """Compare the standard and n-gram models on some example texts"""
+    test_texts = [
+        "Scientists confirm climate change is real and caused by human activity based on decades of research",
+        "BREAKING: Secret miracle cure discovered that doctors don't want you to know about!",
+        "The government announced new policies to address economic challenges through bipartisan effort",
+        "SHOCKING: Alien invasion happening next week, government hiding the truth!",
+        "Research shows that regular exercise and balanced diet contribute to better health outcomes",
+        "URGENT: One simple trick to lose weight without diet or exercise - doctors hate this!"
+    ]
+    
+    print("\nTesting with sample texts:")
+    # Score all sample texts in one batch per model
+    results_std = classifier_std.predict_batch(test_texts)
+    results_ng = classifier_ngrams.predict_batch(test_texts)
+    for text, (prediction_std, probabilities_std), (prediction_ng, probabilities_ng) in zip(
+            test_texts, results_std, results_ng):
+        result_std = "FAKE" if prediction_std == 1 else "REAL"
+        result_ng = "FAKE" if prediction_ng == 1 else "REAL"
+        
+        fake_prob_std = probabilities_std.get(1, 0) * 100
+        fake_prob_ng = probabilities_ng.get(1, 0) * 100
+        
+        print(f"Text: {text[:60]}...")
+        print(f"Standard: {result_std} ({fake_prob_std:.1f}% fake)")
+        print(f"N-grams: {result_ng} ({fake_prob_ng:.1f}% fake)")
+        print("---")
+
+def main(argv=None):
+    args = parse_args(argv)
+    
     # Prepare training data
     csv_path = "data/WELFake_Dataset.csv"
+    model_path = "models/naive_bayes_classifier.pkl"
     if not os.path.exists(csv_path):
         print(f"Error: CSV file not found at {csv_path}")
         print("Please make sure the WELFake_Dataset.csv file is in the data directory")
         return
     
+    # Reuse the saved model when it was built after the data last changed;
+    # --hashing asks for a different kind of model, so it always retrains
+    up_to_date = (os.path.exists(model_path)
+                  and os.path.getmtime(model_path) > os.path.getmtime(csv_path))
+    reuse_model = up_to_date and not args.force and not args.hashing
+    if reuse_model and not args.demo:
+        print(f"Model at {model_path} is up to date with {csv_path}; use --force to retrain")
+        return
+    
     # Load training data
     try:
         documents, labels = load_training_data(
             csv_path, 
             text_column="text",  # Using text content for training
             label_column="label",
-            max_samples= 1000  # Use more samples for better accuracy
+            max_samples=None  # Train on the whole dataset; the sparse counts fit in memory
         )
         
         print(f"Loaded {len(documents)} samples for training")
         
-        # Train classifiers with different configurations
-        print("\n1. Training with standard features (unigrams only):")
-        classifier_std = NaiveBayesClassifier(alpha=1.0, use_ngrams=False)
-        classifier_std.train(documents, labels)
+        if reuse_model:
+            # Only the standard model for the demo comparison needs training
+            print(f"Model at {model_path} is up to date with {csv_path}; running the demo with it")
+            classifier_ngrams = joblib.load(model_path)
+            print("\nTraining:")
+            print("- Standard features (unigrams only)")
+            run_demo(fit_classifier(dict(use_ngrams=False), documents, labels), classifier_ngrams)
+            return
         
-        print("2. Training with n-grams (unigrams + bigrams):")
-        classifier_ngrams = NaiveBayesClassifier(alpha=1.0, use_ngrams=True)
-        classifier_ngrams.train(documents, labels)
+        # Train classifiers with different configurations; they share no state,
+        # so each is fitted in its own worker process at the same time. The
+        # standard model is only needed for the comparison in the demo
+        if args.hashing:
+            # Hashed features need no vocabulary, so there is nothing to prune
+            configs = [dict(use_ngrams=True, use_hashing=True)]
+        else:
+            # Most bigrams occur in a single document; dropping features seen in only
+            # one document shrinks the saved model several times over
+            configs = [dict(use_ngrams=True, min_df=2)]
+        print("\nTraining:")
+        if args.demo:
+            configs.insert(0, dict(use_ngrams=False))
+            print("- Standard features (unigrams only)")
+        print("- N-grams (unigrams + bigrams)" + (", hashed" if args.hashing else ""))
+        classifiers = Parallel(n_jobs=len(configs), backend="loky")(
+            delayed(fit_classifier)(config, documents, labels) for config in configs
+        )
+        classifier_ngrams = classifiers[-1]
         
         # Save the best model (with n-grams)
-        model_path = "models/naive_bayes_classifier.pkl"
         os.makedirs(os.path.dirname(model_path), exist_ok=True)
-        joblib.dump(classifier_ngrams, model_path)
+        # Uncompressed so the app can memory-map the arrays; protocol 5 is the newest pickle format.
+        # Written atomically so an interrupted run never leaves a truncated model behind
+        write_atomic(model_path, lambda f: joblib.dump(classifier_ngrams, f, protocol=5))
+        # Also save plain .npy/.json files next to it, which the app loads fastest. They
+        # must be written after the pickle: the app ignores split files older than it
+        classifier_ngrams.save(os.path.splitext(model_path)[0])
         
         print(f"\nModel trained and saved to {model_path}")
         
-        # Test with some example texts
-        test_texts = [
-            "Scientists confirm climate change is real and caused by human activity based on decades of research",
-            "BREAKING: Secret miracle cure discovered that doctors don't want you to know about!",
-            "The government announced new policies to address economic challenges through bipartisan effort",
-            "SHOCKING: Alien invasion happening next week, government hiding the truth!",
-            "Research shows that regular exercise and balanced diet contribute to better health outcomes",
-            "URGENT: One simple trick to lose weight without diet or exercise - doctors hate this!"
-        ]
-        
-        print("\nTesting with sample texts:")
-        for text in test_texts:
-            prediction_std, probabilities_std = classifier_std.predict(text)
-            prediction_ng, probabilities_ng = classifier_ngrams.predict(text)
-            
-            result_std = "FAKE" if prediction_std == 1 else "REAL"
-            result_ng = "FAKE" if prediction_ng == 1 else "REAL"
-            
-            fake_prob_std = probabilities_std.get(1, 0) * 100
-            fake_prob_ng = probabilities_ng.get(1, 0) * 100
-            
-            print(f"Text: {text[:60]}...")
-            print(f"Standard: {result_std} ({fake_prob_std:.1f}% fake)")
-            print(f"N-grams: {result_ng} ({fake_prob_ng:.1f}% fake)")
-            print("---")
+        if args.demo:
+            run_demo(classifiers[0], classifier_ngrams)
             
     except Exception as e:
         print(f"Error during training: {e}")